@@ -3,19 +3,75 @@ This Module interacts with Gerrit and retrieves Data from Gerrit
 """
 
 import os
+import csv
+import re
 import json
 import logging
+import threading
 import argparse
-import pandas as pd
-from datetime import datetime, timedelta
-from json.decoder import JSONDecodeError
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlunsplit, urlencode
-from typing import Tuple, Union
+from typing import Callable, Tuple, Union
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+log = logging.getLogger(__name__)
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches import FileCache
+except ImportError:
+    CacheControlAdapter = None
+#filelock is needed by cachecontrol for the FileCache
+if not find_spec("filelock"):
+    CacheControlAdapter = None
+try:
+    from dateutil.relativedelta import relativedelta
+except ImportError:
+    relativedelta = None
 try:
     from requests import __version__, Session, adapters, exceptions, urllib3, status_codes
-    logging.debug(f'Available request module of version {__version__}')
+    log.debug('Available request module of version %s', __version__)
 except ImportError:
-    logging.error('Please install requests module. Use pip install requests.')
+    log.error('Please install requests module. Use pip install requests.')
+
+#Number of REST calls run in parallel, also used as the http connection pool size
+MAX_CONCURRENT_REQUESTS = 32
+#Durations like 120Minutes, 48Hours, 2Days, 1Month
+DURATION_PATTERN = re.compile(r'^\s*(\d+)\s*(minutes?|hours?|days?|months?)\s*$', re.IGNORECASE)
+DURATION_UNITS = {"minute": "minutes", "hour": "hours", "day": "days"}
+
+@lru_cache(maxsize=32)
+def _parse_duration(duration: str) -> Union[timedelta, "relativedelta"]:
+    """
+    *Method description :* Method to convert a duration string into a time delta.
+    Cached as the same few durations are parsed again and again. Deliberately not numba jitted,
+    numba has hardly any string support and would fall back to the slower object mode.
+
+    :param duration: Duration like 120Minutes, 48Hours, 2Days, 1Month
+    :type duration: String
+    :raises: :class:`ValueError`: Unsupported duration
+    :raises: :class:`ImportError`: Months duration without python-dateutil installed
+    :returns: :class:`delta`: Time delta of the duration
+    :rtype: :class:`delta`: timedelta or relativedelta
+    """
+    match = DURATION_PATTERN.match(duration)
+    if not match:
+        raise ValueError(f"Unsupported duration {duration}. Supported are Minutes, Hours, Days, Months")
+    delta, unit = int(match.group(1)), match.group(2).lower().rstrip("s")
+    if unit == "month":
+        if relativedelta is None:
+            raise ImportError("Please install python-dateutil module to use Months durations. "
+                              "Use pip install python-dateutil.")
+        return relativedelta(months=delta)
+    return timedelta(**{DURATION_UNITS[unit]: delta})
 
 class GerritApi:
     """
@@ -28,8 +84,13 @@ class GerritApi:
     GET_ALL_ACTIVE_USERS_URI = "/accounts/?q=is:active"
     GET_COMMITS_BY_AGE = "/changes/?q=-age:"
     GET_COMMITS_USING_AFTER = "/changes/?q=after:"
+    DETAILED_ACCOUNTS_OPTION = "&o=DETAILED_ACCOUNTS"
+    #Gerrit takes times without offset as UTC, a "+" offset would be decoded as space in the query
+    GERRIT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # prefix that comes with the json responses.
+    GERRIT_MAGIC_JSON_PREFIX = b")]}'\n"
 
-    def __init__(self, gerrit_server: str, username: str=None, password: str=None):
+    def __init__(self, gerrit_server: str, username: str=None, password: str=None, cache_dir: str=None):
         """
         *Method description :* Initializing values for Gerrit operations from OVF
 
@@ -39,15 +100,24 @@ class GerritApi:
         :type password: String
         :param url: Gerrit URL to get commit details
         :type url: String
+        :param cache_dir: Directory of the on-disk http cache, responses are not cached when not given
+        :type cache_dir: String
         """
         self.gerrit_username = username
         self.gerrit_password = password
         self.gerrit_url = f"https://{gerrit_server}"
-        logging.debug(f"GerritDetails:: {self.gerrit_url}, {self.gerrit_username}, {self.gerrit_password}")
+        #URL template of the account detail endpoint, filled in once per account
+        self._account_detail_tmpl = f"{self.gerrit_url}/accounts/%d/detail"
+        log.debug("GerritDetails:: %s, %s, %s", self.gerrit_url, self.gerrit_username, self.gerrit_password)
         if username and password:
-            self.rest_engine = RestEngine(auth=(self.gerrit_username, self.gerrit_password))
+            self.rest_engine = RestEngine(auth=(self.gerrit_username, self.gerrit_password), cache_dir=cache_dir)
         else:
-            self.rest_engine = RestEngine()
+            self.rest_engine = RestEngine(cache_dir=cache_dir)
+        #Reusable simdjson parser for list responses where only a few keys are read
+        self._sj = simdjson.Parser() if simdjson else None
+        #Account details already fetched in this run, shared by the parallel workers
+        self._account_detail_cache = {}
+        self._account_detail_lock = threading.Lock()
 
     def get_all_projects(self) -> dict:
         """
@@ -62,7 +132,7 @@ class GerritApi:
         for key, value in all_repo_resp.items():
             all_repo_details[key] = {"id": value.get("id"), "description": value.get("description"),
                                  "state": value.get("state")}
-        logging.info(f"List of All repositories : {all_repo_details} {len(all_repo_details)}")
+        log.info("List of All repositories : %s %s", all_repo_details, len(all_repo_details))
         return all_repo_details
 
     def get_all_active_projects(self) -> list:
@@ -77,7 +147,7 @@ class GerritApi:
         for key, value in all_repo_details.items():
             if value["state"] == "ACTIVE":
                 active_repo_list.append(key)
-        logging.info(f"List of active repositories : {active_repo_list} {len(active_repo_list)}")
+        log.info("List of active repositories : %s %s", active_repo_list, len(active_repo_list))
         return active_repo_list
 
     def get_active_user_accounts(self) -> list:
@@ -87,90 +157,197 @@ class GerritApi:
         :returns: :class:`all_users_details`: List of commit changes as dict
         :rtype: :class:`all_users_details`: list
         """
-        all_users_details = []
         all_users_list, mocker_response = [], []
-        all_users_url = f"{self.gerrit_url}{GerritApi.GET_ALL_ACTIVE_USERS_URI}&S=0"
-        response = self.decode_response(self.rest_engine.rest_request(all_users_url))
+        all_users_url = f"{self.gerrit_url}{GerritApi.GET_ALL_ACTIVE_USERS_URI}&S=0&n=500"
+        user_list_decoder = partial(self.decode_response_sj, keys=("_account_id", "_more_accounts"))
+        response = user_list_decoder(self.rest_engine.rest_request(all_users_url))
         all_users_list.extend(response)
         mocker_response = self.no_limit_mocker(response, mocker_response,
-                                        url_to_be_used=f"{self.gerrit_url}{GerritApi.GET_ALL_ACTIVE_USERS_URI}")
+                                        url_to_be_used=f"{self.gerrit_url}{GerritApi.GET_ALL_ACTIVE_USERS_URI}",
+                                        decoder=user_list_decoder)
         if all_users_list:
             all_users_list.extend(mocker_response)
-        logging.info(f"Number Of Active User Accounts in Gerrit: {len(all_users_list)}")
-        for each_user in all_users_list:
-            user_id = each_user.get("_account_id")
-            user_details_url = f"{self.gerrit_url}/accounts/{user_id}/detail"
-            detailed_response = self.decode_response(self.rest_engine.rest_request(user_details_url))
-            all_users_details.append(detailed_response)
-        logging.info(f"Active User Account Details in Gerrit: {all_users_details}")
+        log.info("Number Of Active User Accounts in Gerrit: %s", len(all_users_list))
+        #Account queries with o=DETAILS leave out registered_on of /detail, so details are fetched per account
+        user_ids = [each_user.get("_account_id") for each_user in all_users_list]
+        account_details = self._get_account_details(user_ids)
+        all_users_details = [account_details[user_id] for user_id in user_ids]
+        log.info("Active User Account Details in Gerrit: %s", all_users_details)
         return all_users_details
 
-    def get_commit_details_in_given_period(self, start=None, duration="24Hours", stop=datetime.utcnow()):
+    def get_commit_details_in_given_period(self, start: Union[datetime, str] =None, duration: str ="24Hours",
+                                           stop: datetime =None) -> list:
+        """
+        *Method description :* Method to get commit details from the start time, or for the given duration
+
+        :param start: Start time of the period, calculated from duration and stop when not given.
+                      Timezone aware times are converted to UTC, naive times are taken as UTC.
+        :type start: datetime or String
+        :param duration: Duration like 120Minutes, 48Hours, 2Days, 1Month
+        :type duration: String
+        :param stop: End time of the duration, defaults to the current UTC time
+        :type stop: datetime
+        :returns: :class:`all_commits_list`: List of commit changes as dict
+        :rtype: :class:`all_commits_list`: list
+        """
         all_commits_list, mocker_response = [], []
         if not start:
-            start = self.get_start_time(duration, stop)
-        commits_url = f"{self.gerrit_url}{GerritApi.GET_COMMITS_USING_AFTER}\"{start}\"&S=0"
+            start = self.get_start_time(duration, stop or datetime.now(timezone.utc))
+        if isinstance(start, datetime):
+            if start.tzinfo:
+                start = start.astimezone(timezone.utc)
+            start = start.strftime(GerritApi.GERRIT_TIME_FORMAT)
+        #owner and submitter names come inline with DETAILED_ACCOUNTS, no account lookups are needed
+        commits_query_url = f"{self.gerrit_url}{GerritApi.GET_COMMITS_USING_AFTER}\"{start}\"" \
+                            f"{GerritApi.DETAILED_ACCOUNTS_OPTION}"
+        commits_url = f"{commits_query_url}&S=0&n=500"
         print(commits_url)
         response = self.decode_response(self.rest_engine.rest_request(commits_url))
         all_commits_list.extend(response)
-        mocker_response = self.no_limit_mocker(response, mocker_response,
-                                url_to_be_used=f"{self.gerrit_url}{GerritApi.GET_COMMITS_USING_AFTER}\"{start}\"")
+        mocker_response = self.no_limit_mocker(response, mocker_response, url_to_be_used=commits_query_url)
         if mocker_response:
             all_commits_list.extend(mocker_response)
         for each_commit in all_commits_list:
-            owner_account_url = f"{self.gerrit_url}/accounts/{each_commit.get('owner').get('_account_id')}/detail"
-            each_commit["owner"] = self.decode_response(self.rest_engine.rest_request(owner_account_url)).get("name")
+            each_commit["owner"] = each_commit.get("owner").get("name")
             if each_commit.get("submitter"):
-                submitter_id = each_commit.get('submitter').get('_account_id')
-                submit_account_url = f"{self.gerrit_url}/accounts/{submitter_id}/detail"
-                each_commit["submitter"] = self.decode_response(self.rest_engine.rest_request(
-                                                                                    submit_account_url)).get("name")
+                each_commit["submitter"] = each_commit.get("submitter").get("name")
         print(f"Total commits from {start} is: {len(all_commits_list)}")
         return all_commits_list
 
+    def _get_account_detail(self, account_id: int) -> dict:
+        """
+        *Method description :* Method to get the details of a Gerrit account.
+        Successfully fetched details are cached per account id, so each account is fetched only once
+        per run. Failed calls are not cached and are fetched again on the next call.
+
+        :param account_id: Gerrit account id
+        :type account_id: Integer
+        :returns: :class:`account_detail`: Account details
+        :rtype: :class:`account_detail`: Dict
+        """
+        if account_id in self._account_detail_cache:
+            return self._account_detail_cache[account_id]
+        account_url = self._account_detail_tmpl % account_id
+        response = self.rest_engine.rest_request(account_url)
+        account_detail = self.decode_response(response)
+        if response[0] == 200 and isinstance(account_detail, dict):
+            with self._account_detail_lock:
+                self._account_detail_cache[account_id] = account_detail
+        return account_detail
+
+    def _get_account_details(self, account_ids: list) -> dict:
+        """
+        *Method description :* Method to get the details of the given Gerrit accounts in parallel.
+        Runs on a thread pool over the rest session.
+
+        :param account_ids: Gerrit account ids
+        :type account_ids: List
+        :returns: :class:`account_details`: Details of each account keyed by account id
+        :rtype: :class:`account_details`: Dict
+        """
+        account_ids = list(dict.fromkeys(account_ids))
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return dict(zip(account_ids, executor.map(self._get_account_detail, account_ids)))
+
+    @staticmethod
+    def save_commits_to_csv(commits_list: list, csv_file: str) -> None:
+        """
+        *Method description :* Method to save commit details to a csv file, one column per commit field
+
+        :param commits_list: List of commit changes as dict
+        :type commits_list: list
+        :param csv_file: Name of the csv file to be written
+        :type csv_file: str
+        """
+        fieldnames = list(dict.fromkeys(key for each_commit in commits_list for key in each_commit))
+        with open(csv_file, 'w', newline='') as file_obj:
+            csv_writer = csv.DictWriter(file_obj, fieldnames=fieldnames)
+            csv_writer.writeheader()
+            csv_writer.writerows(commits_list)
+
     @staticmethod
-    def get_start_time(duration, stop):
-        if "minutes" in str(duration).lower():
-            min_delta = int(str(duration).lower().strip("minutes"))
-            start = stop - timedelta(minutes=min_delta)
-        if "hours" in str(duration).lower():
-            hour_delta = int(str(duration).lower().strip("hours"))
-            start = stop - timedelta(hours=hour_delta)
-        elif "days" in str(duration).lower():
-            day_delta = int(str(duration).lower().strip("days"))
-            start = stop - timedelta(days=day_delta)
-        elif "months" in str(duration).lower():
-            month_delta = int(str(duration).lower().strip("months"))
-            start = stop - timedelta(months=month_delta)
-        return start
+    def get_start_time(duration: str, stop: datetime) -> datetime:
+        """
+        *Method description :* Method to get the start time of the given duration ending at stop time
+
+        :param duration: Duration like 120Minutes, 48Hours, 2Days, 1Month
+        :type duration: String
+        :param stop: End time of the duration
+        :type stop: datetime
+        :raises: :class:`ValueError`: Unsupported duration
+        :returns: :class:`start`: Start time of the duration
+        :rtype: :class:`start`: datetime
+        """
+        return stop - _parse_duration(str(duration))
 
     @staticmethod
-    def decode_response(response: str) -> dict:
+    def decode_response(response: Tuple[int, bytes, dict]) -> dict:
         """
         *Method description :* Method to decode rest response with Gerrit Magic Prefix
 
         :param response: Raw REST Response Content
-        :type response: String
+        :type response: Tuple
         :raises: :class:`ValueError`: Invaid Response Json Content
         :returns: :class:`resp_dict`: Dictionary of the given Response content
         :rtype: :class:`resp_dict`: Dictionary
         """
         output = response[1]
-        # prefix that comes with the json responses.
-        gerrit_magic_json_prefix = ")]}'\n"
-        if str(response[0]) == '200' and isinstance(response[1], str):
-            if response[1].startswith(gerrit_magic_json_prefix):
-                output = response[1][len(gerrit_magic_json_prefix):]
+        if str(response[0]) == '200' and isinstance(response[1], bytes):
+            if response[1].startswith(GerritApi.GERRIT_MAGIC_JSON_PREFIX):
+                #memoryview slice skips the prefix without copying the body, stdlib json needs bytes
+                output = memoryview(response[1])[len(GerritApi.GERRIT_MAGIC_JSON_PREFIX):]
+                if orjson is json:
+                    output = bytes(output)
+                try:
+                    output = orjson.loads(output)
+                except ValueError:
+                    output = response[1]
+                    log.error("Invalid Json in response %s", output)
+        else:
+            log.error('Rest Call Failed with the status code %s and response %s', response[0], response[1])
+        return output
+
+    def decode_response_sj(self, response: Tuple[int, bytes, dict], keys: tuple) -> list:
+        """
+        *Method description :* Method to decode a Gerrit list response keeping only the given keys.
+        Values are read from the lazy simdjson document and copied out immediately, so the parser
+        buffer can be reused by the next call. Falls back to decode_response without pysimdjson.
+
+        :param response: Raw REST Response Content
+        :type response: Tuple
+        :param keys: Top level keys to be kept from each element of the list
+        :type keys: Tuple
+        :returns: :class:`output`: List of dictionaries holding only the given keys
+        :rtype: :class:`output`: List
+        """
+        output = []
+        if self._sj is None:
+            decoded = self.decode_response(response)
+            if isinstance(decoded, list):
+                output = [{key: element[key] for key in keys if key in element}
+                          for element in decoded if isinstance(element, dict)]
+            return output
+        if str(response[0]) == '200' and isinstance(response[1], bytes):
+            if response[1].startswith(GerritApi.GERRIT_MAGIC_JSON_PREFIX):
+                document = None
                 try:
-                    output = json.loads(output)
+                    document = self._sj.parse(memoryview(response[1])[len(GerritApi.GERRIT_MAGIC_JSON_PREFIX):])
+                    if isinstance(document, simdjson.Array):
+                        output = [{key: element.at_pointer(f"/{key}") for key in keys if key in element}
+                                  for element in document if isinstance(element, simdjson.Object)]
+                    else:
+                        log.error("Expected a Json list in response %s", response[1])
                 except ValueError:
-                    logging.error(f"Invalid Json in response {output}")
+                    log.error("Invalid Json in response %s", response[1])
+                finally:
+                    #The parser can only be reused once the previous document is released
+                    document = None
         else:
-            logging.error(f'Rest Call Failed with the status code {response[0]} and response {response[1]}')
+            log.error('Rest Call Failed with the status code %s and response %s', response[0], response[1])
         return output
 
     def no_limit_mocker(self, response: str, mocker_response: list, url_to_be_used: str,
-                                                                                def_limit: int =0) -> list:
+                                        def_limit: int =0, decoder: Callable[[tuple], list] =None) -> list:
         """
         *Method description :* Method to mock no_limit option in Gerrit Server
 
@@ -180,26 +357,41 @@ class GerritApi:
         :type mocker_response: list
         :param url_to_be_used: URL to be used for REST Call in no_limits mocker block
         :type url_to_be_used: String
-        :param def_limit: Number Of Commits Limit for GET call
+        :param def_limit: Offset of the previous GET Call Response
         :type def_limit: Integer
+        :param decoder: Method used to decode each page, defaults to decode_response
+        :type decoder: Callable
         :returns: :class:`mocker_response`: Get REST Response in List
         :rtype: :class:`mocker_response`: List
         """
-        if "_more_" in str(response):
-            def_limit = def_limit + 500
-            start_limit = def_limit - 500 + 1
-            logging.info(f"Fetching {start_limit} - {def_limit} Records. Please Wait...")
-            new_url = f"{url_to_be_used}&S={str(def_limit)}&n=500"
-            int_response = self.decode_response(self.rest_engine.rest_request(new_url))
-            mocker_response.extend(int_response)
-            self.no_limit_mocker(int_response, mocker_response, url_to_be_used, def_limit)
-        else:
-            def_limit = def_limit + 500
-            new_url = f"{url_to_be_used}&S={str(def_limit)}&n=500"
-            int_response = self.decode_response(self.rest_engine.rest_request(new_url))
-            mocker_response.extend(int_response)
+        decoder = decoder or self.decode_response
+        int_response = response
+        #Offset paging with S= is the only resume option: Gerrit dropped the _sortkey/N= cursor of
+        #/changes/ in 2.9 and /accounts/ never had one, so both endpoints are paged the same way.
+        while self._has_more_records(int_response):
+            def_limit = def_limit + len(int_response)
+            log.info("Fetching %s - %s Records. Please Wait...", def_limit + 1, def_limit + 500)
+            new_url = "%s&S=%d&n=500" % (url_to_be_used, def_limit)
+            int_response = decoder(self.rest_engine.rest_request(new_url))
+            if isinstance(int_response, list):
+                mocker_response.extend(int_response)
         return mocker_response
 
+    @staticmethod
+    def _has_more_records(response: list) -> bool:
+        """
+        *Method description :* Method to check the Gerrit paging sentinel on the last record of a response.
+        Looking at the last decoded record is constant time, unlike searching the raw body for "_more_".
+
+        :param response: Decoded GET Call Response
+        :type response: list
+        :returns: :class:`has_more`: True if Gerrit has more records to be fetched
+        :rtype: :class:`has_more`: Boolean
+        """
+        if not isinstance(response, list) or not response or not isinstance(response[-1], dict):
+            return False
+        return bool(response[-1].get("_more_changes") or response[-1].get("_more_accounts"))
+
 class RestEngine:
     """
     Class to perform rest operations like PUT, PATCH, POST, GET
@@ -217,7 +409,8 @@ class RestEngine:
 
         :param session_args: Rest arguments that can be set at the session level.
                              Supported: 'headers', 'cookies', 'auth', 'proxies', 'hooks',
-                             'params', 'verify', 'cert', 'stream', 'trust_env', 'max_redirects'
+                             'params', 'verify', 'cert', 'stream', 'trust_env', 'max_redirects',
+                             'cache_dir' (enables an on-disk http cache in the given directory, needs cachecontrol)
         :type session_args: dict
         """
         self.http_session = Session()
@@ -226,8 +419,24 @@ class RestEngine:
         #as verify is set to False,requests in this session will accept any TLS certificate
         #will ignore SSL certificate verification
         self.http_session.verify = session_args.get('verify', False)
-        #Retries to establish a http secure connection.
-        https_adapter = adapters.HTTPAdapter(max_retries=3)
+        #Retries to establish a http secure connection, and GET calls rejected by rate limiting
+        #or server errors with exponential backoff honouring Retry-After. Once retries are used up
+        #the last response is returned, so its status and body reach the caller.
+        retry = urllib3.util.Retry(total=5, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                                   respect_retry_after_header=True, allowed_methods=frozenset(['GET']),
+                                   raise_on_status=False)
+        #Pool is sized to keep one connection per parallel request.
+        adapter_args = {'pool_connections': MAX_CONCURRENT_REQUESTS, 'pool_maxsize': MAX_CONCURRENT_REQUESTS,
+                        'max_retries': retry}
+        https_adapter = adapters.HTTPAdapter(**adapter_args)
+        #Opt-in http cache: responses are stored unencrypted and keyed by URL only, not by credentials
+        if session_args.get('cache_dir'):
+            if CacheControlAdapter:
+                #Responses are cached on disk and revalidated with ETag/Last-Modified as the server allows
+                https_adapter = CacheControlAdapter(cache=FileCache(session_args['cache_dir']), **adapter_args)
+            else:
+                log.error('Please install cachecontrol and filelock modules to use cache_dir. '
+                          'Use pip install cachecontrol[filecache].')
         self.http_session.mount('https://', https_adapter)
         #To set other session parameters supported by requests
         self.http_session.params = session_args.get('params')
@@ -238,6 +447,10 @@ class RestEngine:
         self.http_session.max_redirects = session_args.get('max_redirects')
         self.http_session.cookies.update(session_args.get('cookies', {}))
         self.http_session.trust_env = session_args.get('trust_env')
+        #Bound once, rest_request is called for every REST Call
+        self._request = self.http_session.request
+        #suppress Insecure certificate warning, the filter is process wide so it is set once here
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     @staticmethod
     def build_api_url(netloc: str, scheme: str ="https", path: str ="", query: Union[str, dict]="",
@@ -270,10 +483,10 @@ class RestEngine:
         """
         query_str = urlencode(query) if isinstance(query, dict) else query
         api_url = urlunsplit((scheme, netloc, path, query_str, fragments))
-        logging.debug(f"Api url formed --> {api_url}")
+        log.debug("Api url formed --> %s", api_url)
         return api_url
 
-    def rest_request(self, uri: str, operation: str ='GET', **func_args: str) -> Tuple[int, str, dict]:
+    def rest_request(self, uri: str, operation: str ='GET', **func_args: str) -> Tuple[int, bytes, dict]:
         """
         *Method description :* Common rest request method be called for performing the rest operations.
 
@@ -287,54 +500,48 @@ class RestEngine:
                           Overrides the session arguments.
         :type func_args: dict
         :returns: :class:`response_code`: Response code of the rest request call performed
-                  :class:`response`: Response received from the rest request call
+                  :class:`response`: Raw response body received from the rest request call
                   :class:'response_headers`: Headers in response
         :rtype: :class:`response_code`: int
-                :class:`response`: dict/str
+                :class:`response`: bytes
                 :class:`response_headers`: dict
         """
         response_code, response, response_headers = None, None, None
-        #suppress Insecure certificate warning
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         try:
-            rest_response = self.http_session.request(operation.upper(), uri, **func_args)
-            logging.debug(f'Request uri : {rest_response.request.url}')
-            logging.debug(f'Request method : {rest_response.request.method}')
-            logging.debug(f'Request headers : {rest_response.request.headers}')
-            logging.debug(f'Request data : {rest_response.request.body}')
+            rest_response = self._request(operation.upper(), uri, **func_args)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('Request uri : %s', rest_response.request.url)
+                log.debug('Request method : %s', rest_response.request.method)
+                log.debug('Request headers : %s', rest_response.request.headers)
+                log.debug('Request data : %s', rest_response.request.body)
             response_code, response, response_headers = rest_response.status_code, rest_response.content, rest_response.headers
             #Uncomment the below line if status code has to raise an exception/error
             #rest_response.raise_for_status()
-            if response:
-                try:
-                    response = rest_response.json()
-                except JSONDecodeError:
-                    #default utf-8 encoding is done.
-                    response = rest_response.text
         except exceptions.InvalidURL:
-            logging.error(f'The uri {uri} passed for this {operation.upper()} method is invalid')
+            log.error('The uri %s passed for this %s method is invalid', uri, operation.upper())
         except exceptions.HTTPError:
-            logging.error(f'The {operation.upper()} method failed with the status code {response_code}' \
-                           f' and status message would be any of {status_codes._codes[response_code]}.')
+            log.error('The %s method failed with the status code %s and status message would be any of %s.',
+                      operation.upper(), response_code, status_codes._codes[response_code])
         except exceptions.SSLError:
-            logging.error('SSL Certificate verification failed.')
+            log.error('SSL Certificate verification failed.')
         except exceptions.ConnectionError:
-            logging.error(f'Failed to establish a connection with {uri}')
+            log.error('Failed to establish a connection with %s', uri)
         except exceptions.InvalidHeader:
-            logging.error(f'Invalid header exception. Request headers added : {rest_response.request.headers}')
+            log.error('Invalid header exception. Request headers added : %s', rest_response.request.headers)
         except exceptions.TooManyRedirects:
-            logging.error('The URL redirects has crossed the maximum limit of 30.')
+            log.error('The URL redirects has crossed the maximum limit of 30.')
         except exceptions.Timeout:
-            logging.error(f'{operation.upper()} request timed out. Can be either Connection or Read timeout.')
+            log.error('%s request timed out. Can be either Connection or Read timeout.', operation.upper())
         except exceptions.RequestException:
-            logging.error('Exception occurred while handling request. Please check if the input passed are correct.')
+            log.error('Exception occurred while handling request. Please check if the input passed are correct.')
         except TypeError:
-            logging.error('Please re-check if the input arguments passed are valid.')
-        logging.debug(f'Rest Response : {response}')
-        logging.debug(f'Rest Response status code : {response_code}')
-        logging.debug(f'Rest Response headers : {response_headers}')
-        if response_code:
-            logging.debug(f'Possible status message for {response_code} : {status_codes._codes[response_code]}')
+            log.error('Please re-check if the input arguments passed are valid.')
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Rest Response : %s', response)
+            log.debug('Rest Response status code : %s', response_code)
+            log.debug('Rest Response headers : %s', response_headers)
+            if response_code:
+                log.debug('Possible status message for %s : %s', response_code, status_codes._codes[response_code])
         return response_code, response, response_headers
 
 class Common:
@@ -358,9 +565,9 @@ class Common:
                 data_dict = json.load(file_obj)
             return data_dict
         except AssertionError:
-            logging.error(f'Json file {json_file} doesnot exists')
+            log.error('Json file %s doesnot exists', json_file)
         except json.decoder.JSONDecodeError as decode_err:
-            logging.error(f'unable to parse {json_file}. Kindly validate the json file. Error occured: {decode_err}')
+            log.error('unable to parse %s. Kindly validate the json file. Error occured: %s', json_file, decode_err)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -370,13 +577,14 @@ if __name__ == "__main__":
     parser.add_argument("-d", "--duration", type=str, help="Duration for which gerrit changes to be fetched\n\
         Supported are Minutes, Hours, Days, Months. Examples: 120Minutes, 48Hours, 2Days, 1Month \n\
         Default : 24Hours", default="24Hours")
+    parser.add_argument("-c", "--cachedir", type=str, default=None,
+                        help="Directory to cache Gerrit responses in, stored unencrypted. Default : no cache")
     args = parser.parse_args()
     if args.servername and args.duration:
-        obj = GerritApi(f"{args.servername}")
+        obj = GerritApi(f"{args.servername}", cache_dir=args.cachedir)
         commits_list = obj.get_commit_details_in_given_period(duration=args.duration)
         print(f"Gerrit commits for given {args.duration} is: {len(commits_list)}\n")
         print("Gerrit Commits Details are saved in new_commits.csv file")
-        cl_df = pd.DataFrame(commits_list)
-        cl_df.to_csv('new_commits.csv')
+        GerritApi.save_commits_to_csv(commits_list, 'new_commits.csv')
     else:
         print("Please pass Gerrit server name with -s and duration with -d argument !!!")